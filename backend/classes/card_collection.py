@@ -2,114 +2,145 @@
 """
 
 import json
-from datetime import datetime, timedelta
+from datetime import date
 from classes.date import Date
 
 
-class FlashcardCollection:
-    """Iterate through a collection of flashcards"""
-
-    def __init__(self, flashcard_data: dict):
-        """Initialise the class
-
-        Args:
-            flashcard_data (dict): All the flashcard data for a user
-        """
-        self._flashcard_data = flashcard_data
-        self._today_card_list = {}
-        # Get the card presets
-        with open("card_presets.json", "r") as f:
-            self._card_presets = json.load(f)
-
-        self._not_started = 0
-        self._actively_studying = 0
-        self._recapping = 0
-
-    def _is_for_today(self, card, current_date):
-        """Check whether a flashcard is due for review today
-
-        Args:
-            flashcard_data (dict): The data for an individual flashcard
-        """
-        review_status = card["review_status"]
-        days_until_next_review = int(float(review_status))
-        if (
-            datetime.strptime(card["last_review"], "%d/%m/%Y")
-            + timedelta(days=days_until_next_review)
-            <= current_date
-        ):
-            # Work out if the card is new, being learned, or learned
-            daily_review = card["review_status"].split(".")[0]
-            sub_daily_review = card["review_status"].split(".")[1]
-
-            if daily_review == "0" and sub_daily_review == "0":
-                self._not_started += 1
-                count = self._not_started
-                limit = self._card_presets["notStarted"]
-            elif daily_review == "0":
-                self._actively_studying += 1
-                count = self._actively_studying
-                limit = self._card_presets["activelyStudying"]
-            else:
-                self._recapping += 1
-                count = self._recapping
-                limit = self._card_presets["recapping"]
-            if int(count) < int(limit):
-                return True
-        # If the card should not be added
-        return False
-
-    def _iter_flashcards(self, flashcards, item_to_append_to):
-        """Iterate within flashcards
-
-        Args:
-            flashcards (dict): The flashcard data to be iterated through
-            item_to_append_to (dict): The structure to append the processed flashcards and folders to
-        """
-        current_date = datetime.strptime(Date().get_current_date(), "%d/%m/%Y")
-
-        for flashcard_name, flashcard_data in flashcards.items():
+def _load_card_limits():
+    """Get the maximum number of cards of each type to review in a day, from the card presets
+
+    Returns:
+        dict: The limits for notStarted, activelyStudying and recapping cards
+    """
+    with open("card_presets.json", "r") as f:
+        card_presets = json.load(f)
+
+    return {card_type: int(limit) for card_type, limit in card_presets.items()}
+
+
+def _day_number(date_string):
+    """Convert a dd/mm/yyyy date to a day number (as in date.toordinal), which is much cheaper
+    than parsing it with datetime.strptime
+
+    Args:
+        date_string (str): The date in dd/mm/yyyy format
+
+    Returns:
+        int: The day number
+    """
+    day, month, year = date_string.split("/")
+    return date(int(year), int(month), int(day)).toordinal()
+
+
+def _is_for_today(card, today, card_counts, card_limits):
+    """Check whether a flashcard is due for review today
+
+    Args:
+        card (dict): The data for an individual flashcard
+        today (int): Today's day number, from _day_number
+        card_counts (dict): The number of due cards of each type seen so far in the flashcard set
+        card_limits (dict): The maximum number of cards of each type to review in a day
+    """
+    review_status = card["review_status"]
+    days_until_next_review = int(float(review_status))
+    if _day_number(card["last_review"]) + days_until_next_review <= today:
+        # Work out if the card is new, being learned, or learned
+        daily_review, sub_daily_review = review_status.split(".")
+
+        if daily_review == "0" and sub_daily_review == "0":
+            card_type = "notStarted"
+        elif daily_review == "0":
+            card_type = "activelyStudying"
+        else:
+            card_type = "recapping"
+
+        card_counts[card_type] += 1
+        if card_counts[card_type] < card_limits[card_type]:
+            return True
+    # If the card should not be added
+    return False
+
+
+def compute_today_cards(flashcards: dict, today=None, card_limits=None) -> dict:
+    """Generate the cards to be learned today, keeping the folder structure of flashcards.
+    The data is walked with an explicit stack rather than recursively
+
+    Args:
+        flashcards (dict): The flashcard data to be iterated through
+        today (int, optional): Today's day number, from _day_number. Worked out if not given
+        card_limits (dict, optional): The result of _load_card_limits. Loaded if not given
+
+    Returns:
+        dict: The folders and flashcard sets, with only the cards for today
+    """
+    if today is None:
+        today = _day_number(Date().get_current_date())
+    if card_limits is None:
+        card_limits = _load_card_limits()
+
+    today_cards = {}
+    # Pairs of (folder to read from, folder in the result to append to)
+    stack = [(flashcards, today_cards)]
+
+    while stack:
+        folder, item_to_append_to = stack.pop()
+
+        for flashcard_name, flashcard_data in folder.items():
             # Check if the item is a folder or a flashcard set
-            is_folder = "cards" not in flashcard_data
-            if is_folder:
+            if "cards" not in flashcard_data:
                 # If it's a folder, create a new sub-folder in the result and iterate through it
                 item_to_append_to[flashcard_name] = {}
-                self._iter_flashcards(flashcard_data, item_to_append_to[flashcard_name])
-            else:
-                # If it's a flashcard set, process it
-                current_card = flashcard_data
-                item_to_append_to[flashcard_name] = {}
+                stack.append((flashcard_data, item_to_append_to[flashcard_name]))
+                continue
+
+            # If it's a flashcard set, process each individual card in it
+            card_counts = {"notStarted": 0, "activelyStudying": 0, "recapping": 0}
+            item_to_append_to[flashcard_name] = {
+                "flashcardID": flashcard_data["flashcard_id"],
+                "flashcardName": flashcard_name,
+                "cards": {
+                    card_name: card_data
+                    for card_name, card_data in flashcard_data["cards"].items()
+                    if _is_for_today(card_data, today, card_counts, card_limits)
+                },
+            }
+
+    return today_cards
+
+
+def iter_today_cards(flashcards: dict):
+    """Lazily generate the cards for today, one top-level folder or flashcard set at a time,
+    so the result does not need to be held in memory all at once.
+    Today's date and the card presets are loaded straight away, so errors loading them are
+    raised by this call rather than when the first item is generated.
+    Items are generated in sorted order, matching the sorted keys of jsonify
+
+    Args:
+        flashcards (dict): All the flashcard data for a user
+
+    Returns:
+        generator: Tuples of the name of the top-level item, and its cards to be learned today
+    """
+    today = _day_number(Date().get_current_date())
+    card_limits = _load_card_limits()
+
+    return _generate_today_cards(flashcards, today, card_limits)
+
+
+def _generate_today_cards(flashcards: dict, today: int, card_limits: dict):
+    """Generate the cards for today for each top-level item, see iter_today_cards
+
+    Args:
+        flashcards (dict): All the flashcard data for a user
+        today (int): Today's day number, from _day_number
+        card_limits (dict): The result of _load_card_limits
+
+    Yields:
+        tuple: The name of the top-level item, and its cards to be learned today
+    """
+    for flashcard_name, flashcard_data in sorted(flashcards.items()):
+        today_cards = compute_today_cards(
+            {flashcard_name: flashcard_data}, today, card_limits
+        )
+        yield flashcard_name, today_cards[flashcard_name]
 
-                item_to_append_to[flashcard_name]["flashcardID"] = current_card[
-                    "flashcard_id"
-                ]
-                item_to_append_to[flashcard_name]["flashcardName"] = flashcard_name
-                item_to_append_to[flashcard_name]["cards"] = {}
-
-                # Reset the card counts
-                self._not_started = 0
-                self._actively_studying = 0
-                self._recapping = 0
-
-                # Process each individual card in the flashcard set
-                for card_name, card_data in current_card["cards"].items():
-                    if self._is_for_today(card_data, current_date):
-                        item_to_append_to[flashcard_name]["cards"][
-                            card_name
-                        ] = card_data
-
-    @property
-    def today_card_list(self):
-        """Generate the list of cards for today"""
-        self._iter_flashcards(self._flashcard_data, self._today_card_list)
-
-        return self._today_card_list
-
-    @property
-    def flashcard_data(self):
-        """Get flashcard_data
-
-        Returns:
-            dict: Flashcard data
-        """
-        return self._flashcard_data
@@ -0,0 +1,51 @@
+"""Provides a Flask json provider which uses orjson to serialise responses
+"""
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Serialise responses with orjson, which is implemented in C and writes bytes directly,
+    instead of the standard library json module. Request parsing is left to Flask's default"""
+
+    # Match Flask's default provider: sorted keys, and non-string keys converted to strings
+    _options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    def _dump_bytes(self, obj):
+        """Serialise obj to json bytes
+
+        Args:
+            obj (any): The data to serialise
+
+        Returns:
+            bytes: The serialised json
+        """
+        try:
+            # Dates and other types orjson doesn't handle are formatted the same as in Flask
+            return orjson.dumps(obj, default=self.default, option=self._options)
+        except TypeError:
+            # orjson can't serialise some values the standard library can, such as
+            # integers over 64 bits, so fall back to Flask's default for those
+            return super().dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    def dumps(self, obj, **kwargs):
+        """Serialise data as json
+
+        Args:
+            obj (any): The data to serialise
+
+        Returns:
+            str: The serialised json
+        """
+        return self._dump_bytes(obj).decode("utf-8")
+
+    def response(self, *args, **kwargs):
+        """Serialise the arguments as a json response, used by jsonify.
+        The bytes from orjson are used as the body without decoding them first
+
+        Returns:
+            Response: The json response
+        """
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self._dump_bytes(obj), mimetype=self.mimetype)
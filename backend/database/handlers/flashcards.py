@@ -3,6 +3,9 @@
 
 from database.handlers.database_handler import DatabaseHandler
 
+# The maximum number of writes Firestore accepts in one batch
+MAX_BATCH_WRITES = 500
+
 
 class Flashcards(DatabaseHandler):
     """Provides utility classes for interacting with the flashcards database"""
@@ -23,14 +26,24 @@ class Flashcards(DatabaseHandler):
             card_ids (list): The flashcard IDs to create
             cards (list): A list containing dictionaries storing the data for each flashcard
         """
+        flashcards = self._context.collection("flashcards")
+        # Send the cards in batched writes rather than one request per card
+        batch = self._context.batch()
         for index, card_id in enumerate(card_ids):
-            card = self._context.collection("flashcards").document(card_id)
-            card.set(
+            # Start a new batch once the current one is full
+            if index > 0 and index % MAX_BATCH_WRITES == 0:
+                batch.commit()
+                batch = self._context.batch()
+            batch.set(
+                flashcards.document(card_id),
                 {
                     "front": cards[index]["front"],
                     "back": cards[index]["back"],
-                }
+                },
             )
+        # Only commit if any cards were queued, to avoid an empty write request
+        if card_ids:
+            batch.commit()
 
     def get_flashcard(self, card_id: str):
         """Get a flashcard
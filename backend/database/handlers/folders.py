@@ -35,15 +35,39 @@ class Folders(DatabaseHandler):
             flashcard_name (str): The name of the flashcard
             card_ids (str): The card_ids to be added
         """
+        folder_document = self._context.collection("folders").document(user_id)
+
+        folder_data = folder_document.get().get("data")
+        if folder_data is None:
+            folder_data = {}
+
+        self._add_flashcard_to_folder_data(
+            folder_data, folder, flashcard_id, flashcard_name, card_ids
+        )
+
+        folder_document.set({"data": folder_data})
+
+    def _add_flashcard_to_folder_data(
+        self,
+        folder_data: dict,
+        folder: str,
+        flashcard_id: str,
+        flashcard_name: str,
+        card_ids: list,
+    ):
+        """Add a flashcard to a folder in already fetched folder data, without saving it
+
+        Args:
+            folder_data (dict): The user's folder data, which is modified in place
+            folder (str): The folder path (in the format "folder1/folder2/end_folder")
+            flashcard_id (str): The flashcard id
+            flashcard_name (str): The name of the flashcard
+            card_ids (str): The card_ids to be added
+        """
         # Initialise variables
         folder_path = folder.split("/")
         # Store whether the folder to store the flashcard in is the root folder
         is_root_folder = folder_path == [""]
-        folder = self._context.collection("folders").document(user_id)
-
-        folder_data = folder.get().get("data")
-        if folder_data is None:
-            folder_data = {}
 
         current = folder_data
 
@@ -77,7 +101,7 @@ class Folders(DatabaseHandler):
                 }
 
         # Set the correct data to current, which will also change folder_data
-        if folder_path[-1] not in current.keys() and not is_root_folder:
+        if folder_path[-1] not in current and not is_root_folder:
             current[folder_path[-1]] = {}
 
         # Save the flashcard data
@@ -91,8 +115,6 @@ class Folders(DatabaseHandler):
         else:
             current[folder_path[-1]][flashcard_name] = flashcard_data
 
-        folder.set({"data": folder_data})
-
     def get_user_data(self, user_id: str):
         """Get the folder data for a user"""
         data = self._context.collection(self._db_name).document(user_id).get().to_dict()
@@ -141,21 +163,22 @@ class Folders(DatabaseHandler):
         if edited_flashcard_data is None:
             edited_flashcard_data = flashcard_data
 
-        if flashcard_name in edited_flashcard_data.keys():
-            flashcard_id = edited_flashcard_data.get(flashcard_name).get("flashcard_id")
-            cards = edited_flashcard_data.get(flashcard_name).get("cards")
-            edited_flashcard_data.pop(flashcard_name, None)
+        if flashcard_name in edited_flashcard_data:
+            # Remove the set in place, keeping its data to save in the new location
+            moved_flashcard = edited_flashcard_data.pop(flashcard_name)
+            flashcard_id = moved_flashcard.get("flashcard_id")
+            cards = moved_flashcard.get("cards")
         else:
             raise KeyError("Flashcard not found in current location")
 
-        # Remove the flashcard where it currently is
-        self._context.collection(self._db_name).document(user_id).set(
-            {"data": flashcard_data}
+        # Add the flashcard in the new location
+        self._add_flashcard_to_folder_data(
+            flashcard_data, move_location, flashcard_id, flashcard_name, cards
         )
 
-        # Save the flashcard in the new location
-        self.add_flashcard_to_folder(
-            user_id, move_location, flashcard_id, flashcard_name, cards
+        # Save the removal and the addition together in a single write, so the move is atomic
+        self._context.collection(self._db_name).document(user_id).set(
+            {"data": flashcard_data}
         )
 
     def create_folder(self, user_id: str, folder: str):
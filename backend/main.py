@@ -7,10 +7,12 @@ from routes.api.authentication import authentication_routes
 from routes.api.statistics import statistics_routes
 from routes.api.card_management import card_management_routes
 from routes.api.goals import goal_routes
+from classes.json_provider import OrjsonProvider
 
 print("Starting")
 
 app = Flask(__name__, template_folder="../templates", static_folder="../frontend/build")
+app.json = OrjsonProvider(app)
 CORS(app)
 app.register_blueprint(authentication_routes)
 app.register_blueprint(statistics_routes)
@@ -31,7 +33,7 @@ def serve(path):
     Returns:
         file: The file to render
     """
-    if path != "" and os.path.exists(app.static_folder + "/" + path):
+    if path != "" and os.path.exists(f"{app.static_folder}/{path}"):
         return send_from_directory(app.static_folder, path)
     else:
         return send_from_directory(app.static_folder, "index.html")
@@ -40,7 +40,7 @@ def create_account():
     access_token = request.json.get("accessToken")
     raw_access_token = request.json.get("rawAccessToken")
 
-    if db.verify_id_token(id_token, user_id) is False:
+    if not db.verify_id_token(id_token, user_id):
         return (
             jsonify({"success": False, "error": "User ID does not match token."}),
             403,
@@ -81,7 +81,7 @@ def sign_in():
     access_token = request.json.get("accessToken")
     raw_access_token = request.json.get("rawAccessToken")
 
-    if db.verify_id_token(id_token, user_id) is False:
+    if not db.verify_id_token(id_token, user_id):
         return (
             jsonify({"success": False, "error": "User ID does not match token."}),
             403,
@@ -1,22 +1,57 @@
 """ Routes relating to general card management """
 
+from functools import lru_cache
+from itertools import chain, islice
+import hashlib
 import uuid
-from flask import Blueprint, request, jsonify
+from flask import (
+    Blueprint,
+    Response,
+    current_app,
+    jsonify,
+    request,
+    stream_with_context,
+)
 from database.database import database as db
 from routes.api.validation_wrapper import validate_json
 from routes.api.regex_patterns import REVIEW_STATUS_REGEX, DATE_REGEX
-from classes.card_collection import FlashcardCollection
+from classes.card_collection import iter_today_cards
 import csv
 
 card_management_routes = Blueprint("card_management_routes", __name__)
 
+# SHA-1 state with the uuid5 namespace already absorbed. hashlib.sha1 is OpenSSL's
+# implementation (using SHA extensions where the CPU has them), so each call only
+# has to copy this state and hash the input string
+_NAMESPACE_SHA1 = hashlib.sha1(uuid.NAMESPACE_DNS.bytes)
+
 
 def hash_to_numeric(input_string):
     """Hash a string, convert it to a number, then return a string version of the number
     Importantly, this is deterministic - the same value will be returned
     every time it is hashed"""
-    # Convert the input string to its
-    return str(uuid.uuid5(uuid.NAMESPACE_DNS, input_string))
+    # This produces exactly the same value as str(uuid.uuid5(uuid.NAMESPACE_DNS, input_string)),
+    # which existing IDs and access tokens rely on, but works on the digest bytes directly
+    # instead of building a UUID object and formatting its 128-bit integer
+    sha1 = _NAMESPACE_SHA1.copy()
+    sha1.update(input_string.encode("utf-8"))
+    digest = bytearray(sha1.digest()[:16])
+    # Set the version (5) and variant (RFC 4122) bits
+    digest[6] = (digest[6] & 0x0F) | 0x50
+    digest[8] = (digest[8] & 0x3F) | 0x80
+    hex_digest = digest.hex()
+    return (
+        f"{hex_digest[:8]}-{hex_digest[8:12]}-{hex_digest[12:16]}"
+        f"-{hex_digest[16:20]}-{hex_digest[20:]}"
+    )
+
+
+@lru_cache(maxsize=1024)
+def hash_flashcard_key(flashcard_key):
+    """hash_to_numeric for a flashcard set key (userID + folder + flashcard name), cached since
+    the same sets are saved repeatedly. Only set keys are cached: card keys would evict them on
+    bulk imports, and raw access tokens must not be kept in memory"""
+    return hash_to_numeric(flashcard_key)
 
 
 CREATE_FLASHCARD_FORMAT = {
@@ -98,21 +133,20 @@ def create_flashcard():
         ]
     }
     """
-    try:
-        user_id = request.json.get("userID")
-        flashcard_name = request.json.get("flashcardName")
-        flashcard_description = request.json.get("flashcardDescription")
-        cards = request.json.get("cards")
-        folder = request.json.get("folder")
+    payload = request.get_json()
+    user_id = payload.get("userID")
+    flashcard_name = payload.get("flashcardName")
+    flashcard_description = payload.get("flashcardDescription")
+    cards = payload.get("cards")
+    folder = payload.get("folder")
 
+    try:
         # A hashed version of the userID and flashcard name
-        flashcard_id = hash_to_numeric(user_id + folder + flashcard_name)
+        flashcard_key = user_id + folder + flashcard_name
+        flashcard_id = hash_flashcard_key(flashcard_key)
 
         # Generate the card_ids
-        card_ids = [
-            hash_to_numeric(user_id + folder + flashcard_name + card["front"])
-            for card in cards
-        ]
+        card_ids = [hash_to_numeric(flashcard_key + card["front"]) for card in cards]
 
         # Create the flashcard set
         db.flashcard_set.create_flashcard_set(
@@ -137,11 +171,11 @@ def create_flashcard():
 
         # Give the user read and write access
         db.read_write_access.give_user_access(user_id, flashcard_id)
-
-        return jsonify({"flashcardID": flashcard_id}, 200)
     except Exception as e:
         # Return the error as a json object
-        return jsonify(str(e)), 500
+        return jsonify({"error": str(e)}), 500
+
+    return jsonify({"flashcardID": flashcard_id}, 200)
 
 
 @card_management_routes.route("/api/create-folder", methods=["POST"])
@@ -155,12 +189,13 @@ def create_folder():
     }
     """
     try:
-        user_id = request.json.get("userID")
-        folder = request.json.get("folder")
+        payload = request.get_json()
+        user_id = payload.get("userID")
+        folder = payload.get("folder")
 
         db.folders.create_folder(user_id, folder)
 
-        return jsonify({"success": "Folder " + folder + " created"}), 200
+        return jsonify({"success": f"Folder {folder} created"}), 200
     except Exception as e:
         return jsonify(str(e)), 500
 
@@ -175,16 +210,17 @@ def get_flashcard():
         "flashcardID": "my-flashcard-id"
     }
     """
+    payload = request.get_json()
+    flashcard_id = payload.get("flashcardID")
+    user_id = payload.get("userID")
+
     try:
-        flashcard_id = request.json.get("flashcardID")
-        user_id = request.json.get("userID")
         flashcard_data = db.folders.get_flashcard(user_id, flashcard_id)
-
-        return jsonify(flashcard_data, 200)
-
     except Exception as e:
         # Return the error as a json object
-        return jsonify(str(e)), 500
+        return jsonify({"error": str(e)}), 500
+
+    return jsonify(flashcard_data, 200)
 
 @card_management_routes.route("/api/get-public-flashcard", methods=["GET", "POST"])
 @validate_json(GET_PUBLIC_FLASHCARD_FORMAT)
@@ -239,21 +275,41 @@ def get_today_cards():
     If it is 0.x, it is actively studying
     If it is >= 1.x, it is learned
     """
-    try:
-        user_id = request.json.get("userID")
+    user_id = request.json.get("userID")
 
+    try:
         # Get all flashcards
         flashcards = db.folders.get_user_data(user_id)
 
         if flashcards is None:
             return jsonify(["User has no flashcards"])
 
-        cards_to_return = FlashcardCollection(flashcards).today_card_list
-        return jsonify(cards_to_return)
+        # Load the date and card presets, and filter the first item, before streaming
+        # starts so that errors there still return a json 500
+        today_cards = iter_today_cards(flashcards)
+        first_items = list(islice(today_cards, 1))
     except Exception as e:
         # Return the error as a json object
         return jsonify(str(e)), 500
 
+    def generate_today_cards():
+        """Stream the json object one top-level item at a time, so cards are filtered
+        while earlier items are being sent.
+        Once streaming has started the status code has already been sent, so an error
+        filtering a later item (for example malformed card data) ends the response early,
+        leaving the json incomplete"""
+        yield "{"
+        for index, (flashcard_name, cards) in enumerate(chain(first_items, today_cards)):
+            if index > 0:
+                yield ","
+            yield current_app.json.dumps(flashcard_name) + ":"
+            yield current_app.json.dumps(cards)
+        yield "}"
+
+    return Response(
+        stream_with_context(generate_today_cards()), mimetype="application/json"
+    )
+
 
 @card_management_routes.route("/api/get-all-cards", methods=["POST"])
 @validate_json(GET_ALL_CARDS)
@@ -294,10 +350,11 @@ def move_flashcard_set():
     """
     try:
         # Get the supplied variables
-        user_id = request.json.get("userID")
-        flashcard_name = request.json.get("flashcardName")
-        move_location = request.json.get("moveLocation")
-        current_location = request.json.get("currentLocation")
+        payload = request.get_json()
+        user_id = payload.get("userID")
+        flashcard_name = payload.get("flashcardName")
+        move_location = payload.get("moveLocation")
+        current_location = payload.get("currentLocation")
 
         db.folders.move_flashcard_set(
             user_id, flashcard_name, current_location, move_location
@@ -306,15 +363,8 @@ def move_flashcard_set():
         return (
             jsonify(
                 {
-                    "success": "The flashcard set at "
-                    + "/users/"
-                    + user_id
-                    + "/flashcards/"
-                    + current_location
-                    + "/"
-                    + flashcard_name
-                    + " has been moved to "
-                    + move_location
+                    "success": f"The flashcard set at /users/{user_id}/flashcards/"
+                    f"{current_location}/{flashcard_name} has been moved to {move_location}"
                 }
             ),
             200,
@@ -341,8 +391,9 @@ def update_card_progress():
     }
     """
     try:
-        user_id = request.json.get("userID")
-        card_data = request.json.get("cardData")
+        payload = request.get_json()
+        user_id = payload.get("userID")
+        card_data = payload.get("cardData")
 
         db.folders.update_card_progress(user_id, card_data)
         db.statistics.increase_xp(user_id, len(card_data) * 10)
@@ -364,8 +415,9 @@ def delete_flashcard():
     }
     """
     try:
-        user_id = request.json.get("userID")
-        flashcard_id = request.json.get("flashcardID")
+        payload = request.get_json()
+        user_id = payload.get("userID")
+        flashcard_id = payload.get("flashcardID")
 
         result = db.folders.delete_flashcard(user_id, flashcard_id)
 
@@ -391,9 +443,10 @@ def rename_flashcard():
     }
     """
     try:
-        user_id = request.json.get("userID")
-        flashcard_id = request.json.get("flashcardID")
-        new_name = request.json.get("newName")
+        payload = request.get_json()
+        user_id = payload.get("userID")
+        flashcard_id = payload.get("flashcardID")
+        new_name = payload.get("newName")
 
         result = db.folders.rename_flashcard(user_id, flashcard_id, new_name)
 
@@ -421,9 +474,10 @@ def rename_folder():
     }
     """
     try:
-        user_id = request.json.get("userID")
-        folder_name = request.json.get("currentName")
-        new_name = request.json.get("newName")
+        payload = request.get_json()
+        user_id = payload.get("userID")
+        folder_name = payload.get("currentName")
+        new_name = payload.get("newName")
 
         result = db.folders.rename_folder(user_id, folder_name, new_name)
 
@@ -450,8 +504,9 @@ def delete_folder():
     }
     """
     try:
-        user_id = request.json.get("userID")
-        folder_name = request.json.get("folder")
+        payload = request.get_json()
+        user_id = payload.get("userID")
+        folder_name = payload.get("folder")
 
         result = db.folders.delete_folder(user_id, folder_name)
 
@@ -476,9 +531,10 @@ def delete_card():
     }
     """
     try:
-        user_id = request.json.get("userID")
-        card_id = request.json.get("cardID")
-        flashcard_id = request.json.get("flashcardID")
+        payload = request.get_json()
+        user_id = payload.get("userID")
+        card_id = payload.get("cardID")
+        flashcard_id = payload.get("flashcardID")
 
         result = db.folders.delete_individual_card(user_id, card_id)
         db.flashcard_set.delete_inidividual_card(user_id, flashcard_id, card_id)
@@ -523,9 +579,10 @@ def add_public_flashcard_to_folder():
     }
     """
     try:
-        user_id = request.json.get("userID")
-        flashcard_id = request.json.get("flashcardID")
-        folder = request.json.get("folder")
+        payload = request.get_json()
+        user_id = payload.get("userID")
+        flashcard_id = payload.get("flashcardID")
+        folder = payload.get("folder")
 
         flashcard_data = db.flashcard_set.get_flashcard_set(flashcard_id)
 
@@ -558,8 +615,9 @@ def flashcard_exists():
     }
     """
     try:
-        user_id = request.json.get("userID")
-        flashcard_id = request.json.get("flashcardID")
+        payload = request.get_json()
+        user_id = payload.get("userID")
+        flashcard_id = payload.get("flashcardID")
 
         result = db.folders.flashcard_exists(user_id, flashcard_id)
 
@@ -610,17 +668,15 @@ def import_flashcards():
             })
 
         # A hashed version of the userID and flashcard name
-        flashcard_id = hash_to_numeric(user_id + folder + flashcard_name)
+        flashcard_key = user_id + folder + flashcard_name
+        flashcard_id = hash_flashcard_key(flashcard_key)
 
         flashcard_exists = db.folders.flashcard_exists(user_id, flashcard_id)
         if flashcard_exists:
             return jsonify({"error": "Flashcard set name already exists"}), 400
 
         # Generate the card_ids
-        card_ids = [
-            hash_to_numeric(user_id + folder + flashcard_name + card["front"])
-            for card in cards
-        ]
+        card_ids = [hash_to_numeric(flashcard_key + card["front"]) for card in cards]
 
         # Create the flashcard set
         db.flashcard_set.create_flashcard_set(
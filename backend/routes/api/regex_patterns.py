@@ -1,13 +1,16 @@
-""" Contains a number of regex patterns for checking API requests are valid """
+""" Contains a number of regex patterns for checking API requests are valid.
+Patterns are compiled once on import, rather than each time a request is checked """
+
+import re
 
 # Check if a value is in the format number.number
-REVIEW_STATUS_REGEX = r"^\d+\.\d+$"
+REVIEW_STATUS_REGEX = re.compile(r"^\d+\.\d+$")
 
 # Check a value is in dd/mm/yyyy format
-DATE_REGEX = r"^(0[1-9]|[12][0-9]|3[01])/(0[1-9]|1[0-2])/\d{4}$"
+DATE_REGEX = re.compile(r"^(0[1-9]|[12][0-9]|3[01])/(0[1-9]|1[0-2])/\d{4}$")
 
 # Check if a value is a positive number
-NUMBER = r"^\d+$"
+NUMBER = re.compile(r"^\d+$")
 
 # See if a card status has the right information
-CARD_STATUS = r"^(right|wrong|easy)$"
+CARD_STATUS = re.compile(r"^(right|wrong|easy)$")
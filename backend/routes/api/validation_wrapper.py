@@ -1,9 +1,13 @@
 """Provides a wrapper function to validate the json of a request
 """
 
+import json
 from functools import wraps
 from flask import request, jsonify
-from verification.api_error_checking import check_request_json
+from verification.api_error_checking import (
+    check_request_json,
+    compile_expected_format,
+)
 from database.jwt_handler import JwtHandler
 
 
@@ -13,29 +17,32 @@ def validate_json(expected_format):
     Args:
         expected_format (dict): The expected json format
     """
+    # The format is fixed per route, so only work out its keys, values and error text once.
+    # The format is shown as json, with compiled regex patterns shown as their pattern text
+    compiled_format = compile_expected_format(expected_format)
+    expected_format_message = ". The request should be in the format: " + json.dumps(
+        expected_format, default=lambda pattern: pattern.pattern
+    )
 
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
             try:
-                result = check_request_json(expected_format, request.json)
+                payload = request.get_json()
+                result = check_request_json(
+                    expected_format, payload, compiled_format
+                )
                 # Check the json
                 if result is not True:
                     return (
-                        jsonify(
-                            {
-                                "error": result
-                                + ". The request should be in the format: "
-                                + str(expected_format)
-                            }
-                        ),
+                        jsonify({"error": result + expected_format_message}),
                         400,
                     )
                 # If the request needs authenticating (if it has jwtToken in the format)
                 if "jwtToken" in expected_format:
                     # Get the user ID from the jwt wrapper
                     jwt = JwtHandler()
-                    jwt_token = request.json.get("jwtToken")
+                    jwt_token = payload.get("jwtToken")
                     decoded_token = jwt.decode(jwt_token)
 
                     if decoded_token is None:
@@ -46,8 +53,8 @@ def validate_json(expected_format):
 
                     user_id = decoded_token["userID"]
 
-                    # Add the user ID to request.json
-                    request.json["userID"] = user_id
+                    # Add the user ID to request.json (payload is the cached parsed body)
+                    payload["userID"] = user_id
             except Exception as e:
                 return jsonify({"error": str(e)}), 500
 
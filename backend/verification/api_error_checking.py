@@ -31,27 +31,51 @@ def append_items_to_array(dictionary, result=[]):
     return result
 
 
-def check_request_json(expected_format, request):
-    """Checks if the keys in the request match the keys in the expected format"""
-    # Make an array of the expected keys and actual keys
-    expected_format_arr = dict_to_array(expected_format)
+def compile_expected_format(expected_format):
+    """Work out the keys and values of an expected format, so they can be reused when checking
+    many requests against the same format
+
+    Returns:
+        tuple: The expected keys (from dict_to_array) and expected values
+    """
+    return (
+        dict_to_array(expected_format),
+        append_items_to_array(expected_format, result=[]),
+    )
+
+
+def check_request_json(expected_format, request, compiled_format=None):
+    """Checks if the keys in the request match the keys in the expected format
+
+    Args:
+        expected_format (dict): The expected json format
+        request (dict): The request json
+        compiled_format (tuple, optional): The result of compile_expected_format for
+        expected_format. Worked out from expected_format if not given
+    """
+    if compiled_format is None:
+        compiled_format = compile_expected_format(expected_format)
+    expected_format_arr, expected_values = compiled_format
+
+    # Make an array of the actual keys to compare with the expected keys
     request_arr = dict_to_array(request)
     keys_correct = expected_format_arr == request_arr
 
     # If the keys of both match
     if keys_correct:
-        expected_values = append_items_to_array(expected_format, result=[])
         request_values = append_items_to_array(request, result=[])
 
         # Check if the values match the expected format
         for i, expected_value in enumerate(expected_values):
-            if not re.match(expected_value, request_values[i]):
+            # Patterns from regex_patterns.py are already compiled
+            if hasattr(expected_value, "match"):
+                matched = expected_value.match(request_values[i])
+            else:
+                matched = re.match(expected_value, request_values[i])
+            if not matched:
                 return (
-                    "Value for '"
-                    + expected_values[i]
-                    + "' does not match the expected pattern '"
-                    + request_values[i]
-                    + "'"
+                    f"Value for '{getattr(expected_value, 'pattern', expected_value)}' "
+                    f"does not match the expected pattern '{request_values[i]}'"
                 )
     else:
         return "Your supplied json keys do not match the expected format"
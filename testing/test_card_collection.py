@@ -0,0 +1,108 @@
+import sys
+import os
+from datetime import date
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..', 'backend')
+sys.path.append(src_path)
+from classes.card_collection import compute_today_cards, iter_today_cards
+
+# 10/05/2024, as a day number
+TODAY = date(2024, 5, 10).toordinal()
+
+CARD_LIMITS = {"notStarted": 3, "activelyStudying": 3, "recapping": 3}
+
+def card(review_status, last_review):
+    return {"review_status": review_status, "last_review": last_review}
+
+def test_folder_structure() :
+    """ Test folders, empty folders and flashcard set details are kept """
+
+    flashcards = {
+        "folder1": {
+            "empty": {},
+            "folder2": {
+                "set1": {"flashcard_id": "id1", "cards": {"c1": card("0.0", "10/05/2024")}},
+            },
+        },
+        "set2": {"flashcard_id": "id2", "cards": {}},
+    }
+
+    assert compute_today_cards(flashcards, TODAY, CARD_LIMITS) == {
+        "folder1": {
+            "empty": {},
+            "folder2": {
+                "set1": {
+                    "flashcardID": "id1",
+                    "flashcardName": "set1",
+                    "cards": {"c1": card("0.0", "10/05/2024")},
+                },
+            },
+        },
+        "set2": {"flashcardID": "id2", "flashcardName": "set2", "cards": {}},
+    }
+
+def test_due_dates() :
+    """ Test cards are only returned once last review + review days is today or earlier """
+
+    cards = {
+        # Due today
+        "due_today": card("2.0", "08/05/2024"),
+        # Overdue, across a month and year boundary
+        "overdue": card("5.0", "30/12/2023"),
+        # Due tomorrow
+        "due_tomorrow": card("3.0", "08/05/2024"),
+        # Reviewed in the future
+        "future": card("0.0", "11/05/2024"),
+        # Actively studying cards are due on the day they were last reviewed
+        "studying": card("0.4", "10/05/2024"),
+    }
+    result = compute_today_cards({"set": {"flashcard_id": "id", "cards": cards}}, TODAY, CARD_LIMITS)
+
+    assert list(result["set"]["cards"]) == ["due_today", "overdue", "studying"]
+
+def test_card_limits() :
+    """ Test the number of due cards of each type is capped per flashcard set """
+
+    card_limits = {"notStarted": 2, "activelyStudying": 3, "recapping": 1}
+    cards = {
+        "new1": card("0.0", "01/05/2024"),
+        "new2": card("0.0", "01/05/2024"),
+        "studying1": card("0.2", "01/05/2024"),
+        "studying2": card("0.4", "01/05/2024"),
+        "studying3": card("0.6", "01/05/2024"),
+        "recap1": card("1.0", "01/05/2024"),
+        # Not due, so does not count towards the limit
+        "not_due": card("0.0", "20/05/2024"),
+    }
+    flashcards = {
+        "set1": {"flashcard_id": "id1", "cards": cards},
+        "set2": {"flashcard_id": "id2", "cards": {"new3": card("0.0", "01/05/2024")}},
+    }
+    result = compute_today_cards(flashcards, TODAY, card_limits)
+
+    # A card is only returned while the count of due cards of its type is below the limit
+    assert list(result["set1"]["cards"]) == ["new1", "studying1", "studying2"]
+
+    # Counts are reset for each flashcard set
+    assert list(result["set2"]["cards"]) == ["new3"]
+
+def test_iter_today_cards() :
+    """ Test iter_today_cards generates the same cards as compute_today_cards, in sorted order """
+
+    flashcards = {
+        "set_b": {"flashcard_id": "id_b", "cards": {"c1": card("0.0", "01/05/2024")}},
+        "folder_a": {
+            "set_c": {"flashcard_id": "id_c", "cards": {"c2": card("9.0", "01/01/2000")}},
+        },
+    }
+    current_dir = os.getcwd()
+    # iter_today_cards loads card_presets.json from the root folder
+    os.chdir(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+    try:
+        today_cards = list(iter_today_cards(flashcards))
+        expected_cards = compute_today_cards(flashcards)
+    finally:
+        os.chdir(current_dir)
+
+    assert [name for name, _ in today_cards] == ["folder_a", "set_b"]
+    assert dict(today_cards) == expected_cards
@@ -0,0 +1,39 @@
+import uuid
+import sys
+import os
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_path = os.path.join(current_dir, '..', 'backend')
+sys.path.append(src_path)
+from routes.api.card_management import hash_to_numeric
+
+def test_hash_to_numeric_matches_uuid5():
+    """ hash_to_numeric must always equal uuid5, since stored IDs and access tokens rely on it """
+
+    inputs = [
+        # Empty string
+        "",
+        # ASCII
+        "my-id",
+        "my-idparent-name/folder1My new set",
+        "my-idparent-nameMy new setFront 1",
+        "with spaces, punctuation!?\n\ttabs",
+        # Non-ASCII
+        "café",
+        "Ünïcödé flashcards",
+        "漢字のカード",
+        "emoji 🐬🐬",
+        # Long inputs
+        "a" * 1000,
+        "my-id" + "folder/" * 200 + "set",
+        "🐬" * 500,
+    ]
+
+    for input_string in inputs:
+        assert hash_to_numeric(input_string) == str(uuid.uuid5(uuid.NAMESPACE_DNS, input_string))
+
+def test_hash_to_numeric_is_deterministic():
+    """ The same value should be returned every time a string is hashed """
+
+    assert hash_to_numeric("my-id") == hash_to_numeric("my-id")
+
+    assert hash_to_numeric("my-id") != hash_to_numeric("my-id2")